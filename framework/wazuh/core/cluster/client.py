@@ -8,7 +8,7 @@ import logging
 import ssl
 import traceback
 from time import perf_counter
-from typing import List, Tuple
+from typing import Coroutine, List, Tuple
 
 import uvloop
 from wazuh.core.cluster import common
@@ -64,7 +64,7 @@ class AbstractClientManager:
         self.extra_args = {}
         self.loop = asyncio.get_running_loop()
 
-    def add_tasks(self) -> List[Tuple[asyncio.coroutine, Tuple]]:
+    def add_tasks(self) -> List[Tuple[Coroutine, Tuple]]:
         """Add client tasks to the task list.
 
         The client tasks are just test functions made to test the protocol.
@@ -7,6 +7,7 @@ import asyncio
 import contextlib
 import datetime
 import hashlib
+import itertools
 import json
 import logging
 import os
@@ -16,6 +17,7 @@ import ssl
 import struct
 import time
 import traceback
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
@@ -28,6 +30,10 @@ from wazuh.core.cluster import cluster
 from wazuh.core.cluster import utils as cluster_utils
 from wazuh.core.config.models.server import ServerConfig
 
+# Monotonic counter used to name incoming strings. next() on it is an atomic C-level increment, much cheaper
+# than drawing a random number per received string, and names cannot collide within the process.
+_str_name_counter = itertools.count()
+
 
 class Response:
     """Define and store a response from a request."""
@@ -803,7 +809,7 @@ class Handler(asyncio.Protocol):
         bytes
             String ID.
         """
-        name = str(random.SystemRandom().randint(0, 2**32 - 1)).encode()
+        name = str(next(_str_name_counter)).encode()
         self.in_str[name] = InBuffer(total=int(data))
         return b'ok', name
 
@@ -1265,11 +1271,24 @@ def asyncio_exception_handler(loop, context: Dict):
     )
 
 
+# Cache of pre-built callable descriptors keyed by the id of the function object. Serialized callables come
+# from the small, fixed set of API endpoints, so the attribute introspection only needs to run once per
+# function. The function itself is stored next to its descriptor so its id cannot be reused while cached.
+_callable_descriptors: Dict[int, Tuple[Callable, Dict]] = {}
+
+
 class WazuhJSONEncoder(json.JSONEncoder):
     """Define special JSON encoder for Wazuh."""
 
     def default(self, obj):
         if callable(obj):
+            # Bound methods are not cached: their descriptor depends on the instance and the method object
+            # itself is usually ephemeral.
+            cacheable = not hasattr(obj, '__self__')
+            if cacheable:
+                cached = _callable_descriptors.get(id(obj))
+                if cached is not None and cached[0] is obj:
+                    return cached[1]
             result = {'__callable__': {}}
             attributes = result['__callable__']
             if hasattr(obj, '__name__'):
@@ -1282,6 +1301,8 @@ class WazuhJSONEncoder(json.JSONEncoder):
                 if isinstance(obj.__self__, Wazuh):
                     attributes['__wazuh__'] = obj.__self__.to_dict()
             attributes['__type__'] = type(obj).__name__
+            if cacheable:
+                _callable_descriptors[id(obj)] = (obj, result)
             return result
         elif isinstance(obj, exception.WazuhException):
             result = {'__wazuh_exception__': {'__class__': obj.__class__.__name__, '__object__': obj.to_dict()}}
@@ -1297,6 +1318,53 @@ class WazuhJSONEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+@lru_cache(maxsize=512)
+def _resolve_callable(module_path: str, qualname: str, funcname: str) -> Callable:
+    """Resolve an encoded function or static method to the callable it references.
+
+    The module import and getattr chain are cached since decoded requests reference the same small set of
+    API endpoints over and over.
+
+    Parameters
+    ----------
+    module_path : str
+        Module the callable lives in.
+    qualname : str
+        Qualified name of the callable.
+    funcname : str
+        Name of the callable.
+
+    Returns
+    -------
+    callable
+        Referenced callable.
+    """
+    qualname = qualname.split('.')
+    classname = qualname[0] if len(qualname) > 1 else None
+    module = import_module(module_path)
+    if classname is None:
+        return getattr(module, funcname)
+    else:
+        return getattr(getattr(module, classname), funcname)
+
+
+_wazuh_instance = None
+
+
+def _get_wazuh_instance() -> Wazuh:
+    """Get a shared Wazuh instance to rebuild encoded bound methods without reconstructing it per request.
+
+    Returns
+    -------
+    Wazuh
+        Shared Wazuh instance.
+    """
+    global _wazuh_instance
+    if _wazuh_instance is None:
+        _wazuh_instance = Wazuh()
+    return _wazuh_instance
+
+
 def as_wazuh_object(dct: Dict):
     try:
         if '__callable__' in dct:
@@ -1304,18 +1372,10 @@ def as_wazuh_object(dct: Dict):
             funcname = encoded_callable['__name__']
             if '__wazuh__' in encoded_callable:
                 # Encoded Wazuh instance method.
-                wazuh = Wazuh()
-                return getattr(wazuh, funcname)
+                return getattr(_get_wazuh_instance(), funcname)
             else:
                 # Encoded function or static method.
-                qualname = encoded_callable['__qualname__'].split('.')
-                classname = qualname[0] if len(qualname) > 1 else None
-                module_path = encoded_callable['__module__']
-                module = import_module(module_path)
-                if classname is None:
-                    return getattr(module, funcname)
-                else:
-                    return getattr(getattr(module, classname), funcname)
+                return _resolve_callable(encoded_callable['__module__'], encoded_callable['__qualname__'], funcname)
         elif '__wazuh_exception__' in dct:
             wazuh_exception = dct['__wazuh_exception__']
             return getattr(exception, wazuh_exception['__class__']).from_dict(wazuh_exception['__object__'])
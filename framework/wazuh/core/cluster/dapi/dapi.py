@@ -4,23 +4,21 @@
 
 import asyncio
 import contextlib
-import itertools
 import json
 import logging
-import operator
 import os
 import time
 from collections import defaultdict
 from concurrent.futures import process
 from copy import copy, deepcopy
-from functools import partial, reduce
-from operator import or_
+from functools import partial
 from typing import Callable, Dict, List, Tuple
 
 import wazuh.core.cluster.cluster
 import wazuh.core.cluster.utils
 import wazuh.core.manager
 import wazuh.core.results as wresults
+from cachetools import TTLCache, cached
 from sqlalchemy.exc import OperationalError
 from wazuh import agent
 from wazuh.cluster import get_node_wrapper, get_nodes_info
@@ -30,11 +28,152 @@ from wazuh.core.cluster import local_client
 from wazuh.core.config.client import CentralizedConfig
 from wazuh.core.exception import WazuhClusterError, WazuhError, WazuhException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 pools = common.mp_pools.get()
 
 authentication_funcs = {'check_token', 'check_user_master', 'get_permissions', 'get_security_conf'}
 events_funcs = {'send_event_to_analysisd'}
 
+_json_encoder = c_common.WazuhJSONEncoder()
+
+# Node information is static while the process is running, but a short TTL is kept so a configuration
+# reload is eventually noticed without reading the configuration on every request.
+_NODE_INFO_CACHE_TTL = 10
+_node_info_cache = TTLCache(maxsize=1, ttl=_NODE_INFO_CACHE_TTL)
+
+
+@cached(cache=_node_info_cache)
+def _get_node_info_cached() -> Dict:
+    """Get the local node information, caching it for a short period of time.
+
+    `DistributedAPI.__init__` needs this information on every request, so it is kept out of the
+    per-request critical path.
+
+    Returns
+    -------
+    dict
+        Dict containing current node_name and node_type.
+    """
+    return wazuh.core.cluster.cluster.get_node()
+
+
+# Agent-to-node placement changes infrequently compared to the API call rate, so solver node lookups are
+# briefly cached to avoid scanning the agents database on repeated fan-outs.
+_SOLVER_CACHE_TTL = 2
+_agents_node_map_cache = TTLCache(maxsize=1024, ttl=_SOLVER_CACHE_TTL)
+_system_nodes_cache = TTLCache(maxsize=1, ttl=_SOLVER_CACHE_TTL)
+
+
+def clear_dapi_caches():
+    """Clear the module-level TTL caches.
+
+    Mainly useful for tests, so values cached under one test's patches are not served to the next one.
+    """
+    _node_info_cache.clear()
+    _agents_node_map_cache.clear()
+    _system_nodes_cache.clear()
+
+
+@cached(cache=_agents_node_map_cache)
+def _get_agents_node_map(agent_ids: Tuple) -> Tuple:
+    """Get the node each requested agent is connected to.
+
+    Parameters
+    ----------
+    agent_ids : tuple
+        Requested agent IDs.
+
+    Returns
+    -------
+    tuple
+        Tuple of (node_name, agent_id) pairs.
+    """
+    system_agents = agent.Agent.get_agents_overview(select=['node_name'], limit=None, filters={'id': list(agent_ids)})[
+        'items'
+    ]
+    return tuple((element.get('node_name', ''), element['id']) for element in system_agents)
+
+
+@cached(cache=_system_nodes_cache)
+def _get_system_nodes_cached() -> Tuple:
+    """Get the distinct node names registered agents are connected to.
+
+    Returns
+    -------
+    tuple
+        Tuple of node names.
+    """
+    agents = agent.Agent.get_agents_overview(select=['node_name'], limit=None)['items']
+    return tuple(dict.fromkeys(element['node_name'] for element in agents))
+
+
+def _decode_wazuh_objects(obj):
+    """Recursively apply `as_wazuh_object` to every dict node of an already parsed JSON object.
+
+    It replicates the behaviour of the `object_hook` parameter of `json.loads`, which orjson does not support.
+
+    Parameters
+    ----------
+    obj : object
+        Parsed JSON object.
+
+    Returns
+    -------
+    object
+        Parsed JSON object with Wazuh objects decoded.
+    """
+    if isinstance(obj, dict):
+        return c_common.as_wazuh_object({key: _decode_wazuh_objects(value) for key, value in obj.items()})
+    elif isinstance(obj, list):
+        return [_decode_wazuh_objects(element) for element in obj]
+    return obj
+
+
+def _dumps(obj) -> bytes:
+    """Serialize an object containing Wazuh objects to JSON bytes, using orjson when available.
+
+    Parameters
+    ----------
+    obj : object
+        Object to serialize.
+
+    Returns
+    -------
+    bytes
+        Serialized object.
+    """
+    if orjson is not None:
+        # Datetimes must reach the default callback so they keep the WazuhJSONEncoder format on the wire, and
+        # non-str dict keys must be coerced to str as json.dumps does instead of raising TypeError.
+        return orjson.dumps(
+            obj,
+            default=_json_encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, cls=c_common.WazuhJSONEncoder).encode()
+
+
+def _loads(data):
+    """Deserialize JSON decoding any Wazuh object in it, using orjson when available.
+
+    Parameters
+    ----------
+    data : bytes or str
+        JSON to deserialize.
+
+    Returns
+    -------
+    object
+        Deserialized object.
+    """
+    if orjson is not None:
+        return _decode_wazuh_objects(orjson.loads(data))
+    return json.loads(data, object_hook=c_common.as_wazuh_object)
+
 
 class DistributedAPI:
     """Represents a distributed API request."""
@@ -58,6 +197,7 @@ class DistributedAPI:
         nodes: list = None,
         api_timeout: int = None,
         remove_denied_nodes: bool = False,
+        allow_raw_response: bool = False,
     ):
         """Class constructor.
 
@@ -97,6 +237,9 @@ class DistributedAPI:
             Timeout set in source API for the request
         remove_denied_nodes : bool
             Whether to remove denied (RBAC) nodes from response's failed items or not.
+        allow_raw_response : bool
+            Whether a forwarded response may be returned as raw JSON bytes when it would only be
+            re-serialized by the caller. Used by APIRequestQueue. Default `False`
         """
         self.logger = logger
         self.f = f
@@ -104,7 +247,7 @@ class DistributedAPI:
         self.node = node if node is not None else local_client
         self.server_config = CentralizedConfig.get_server_config() if node is None else node.server_config
         self.debug = debug
-        self.node_info = wazuh.core.cluster.cluster.get_node() if node is None else node.get_node()
+        self.node_info = _get_node_info_cached() if node is None else node.get_node()
         self.request_type = request_type
         self.wait_for_complete = wait_for_complete
         self.from_cluster = from_cluster
@@ -121,22 +264,69 @@ class DistributedAPI:
 
         self.local_clients = []
         self.local_client_arg = local_client_arg
+        # The executor only depends on the function, so it is resolved here instead of on every execution.
+        # Not every callable defines __name__ (e.g. functools.partial); those go to the default pool.
+        f_name = getattr(self.f, '__name__', None)
+        if 'thread_pool' in pools:
+            self.pool = pools.get('thread_pool')
+        elif f_name in authentication_funcs:
+            self.pool = pools.get('authentication_pool')
+        elif f_name in events_funcs:
+            self.pool = pools.get('events_pool')
+        else:
+            self.pool = pools.get('process_pool')
         api_request_timeout = CentralizedConfig.get_management_api_config().intervals.request_timeout
         self.api_request_timeout = max(api_timeout, api_request_timeout) if api_timeout else api_request_timeout
         self.remove_denied_nodes = remove_denied_nodes
+        self.allow_raw_response = allow_raw_response
+        # The routing decision only depends on request_type, node type and from_cluster, so it is resolved
+        # once on the first dispatch instead of re-evaluating the branch chain on every request. It is not
+        # resolved here because node_info is only required to be complete when a request is dispatched.
+        self._dispatch = None
 
-    def debug_log(self, message):
+    def _pick_dispatch(self) -> Callable:
+        """Select the method that will handle the request.
+
+        Returns
+        -------
+        Callable
+            Bound method among execute_local_request, forward_request and execute_remote_request.
+        """
+        # First case: execute the request locally.
+        # If the cluster is disabled or the request type is local_any
+        # if the request was made in the master node and the request type is local_master
+        # if the request came forwarded from the master node and its type is distributed_master
+        if (
+            self.request_type == 'local_any'
+            or (self.request_type == 'local_master' and self.node_info['type'] == 'master')
+            or (self.request_type == 'distributed_master' and self.from_cluster)
+        ):
+            return self.execute_local_request
+
+        # Second case: forward the request
+        # Only the master node will forward a request, and it will only be forwarded if its type is distributed_
+        # master
+        if self.request_type == 'distributed_master' and self.node_info['type'] == 'master':
+            return self.forward_request
+
+        # Last case: execute the request remotely.
+        # A request will only be executed remotely if it was made in a worker node and its type isn't local_any
+        return self.execute_remote_request
+
+    def debug_log(self, message, *args):
         """Use debug or debug2 depending on the log type.
 
         Parameters
         ----------
         message : str
-            Full log message.
+            Log message, optionally with %-style placeholders.
+        args
+            Arguments for the message placeholders, formatted lazily by the logging machinery.
         """
         if self.logger.name == 'wazuh-api':
-            self.logger.debug2(message)
+            self.logger.debug2(message, *args)
         else:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
 
     async def distribute_function(self) -> [Dict, exception.WazuhException]:
         """Distribute an API call.
@@ -148,34 +338,19 @@ class DistributedAPI:
         """
         try:
             if 'password' in self.f_kwargs:
-                self.debug_log(f"Receiving parameters { {**self.f_kwargs, 'password': '****'} }")
+                self.debug_log('Receiving parameters %s', {**self.f_kwargs, 'password': '****'})
             elif 'token_nbf_time' in self.f_kwargs:
-                self.logger.debug(f'Decoded token {self.f_kwargs}')
-            else:
-                self.debug_log(f'Receiving parameters {self.f_kwargs}')
-
-            # First case: execute the request locally.
-            # If the distributed api is not enabled
-            # If the cluster is disabled or the request type is local_any
-            # if the request was made in the master node and the request type is local_master
-            # if the request came forwarded from the master node and its type is distributed_master
-            if (
-                self.request_type == 'local_any'
-                or (self.request_type == 'local_master' and self.node_info['type'] == 'master')
-                or (self.request_type == 'distributed_master' and self.from_cluster)
-            ):
-                response = await self.execute_local_request()
-
-            # Second case: forward the request
-            # Only the master node will forward a request, and it will only be forwarded if its type is distributed_
-            # master
-            elif self.request_type == 'distributed_master' and self.node_info['type'] == 'master':
-                response = await self.forward_request()
-
-            # Last case: execute the request remotely.
-            # A request will only be executed remotely if it was made in a worker node and its type isn't local_any
+                self.logger.debug('Decoded token %s', self.f_kwargs)
             else:
-                response = await self.execute_remote_request()
+                self.debug_log('Receiving parameters %s', self.f_kwargs)
+
+            if self._dispatch is None:
+                self._dispatch = self._pick_dispatch()
+            response = await self._dispatch()
+
+            if isinstance(response, bytes):
+                # Raw serialized response: the caller sends it back over the wire unchanged.
+                return response
 
             try:
                 response = (
@@ -288,17 +463,8 @@ class DistributedAPI:
 
                 else:
                     loop = asyncio.get_event_loop()
-                    if 'thread_pool' in pools:
-                        pool = pools.get('thread_pool')
-                    elif self.f.__name__ in authentication_funcs:
-                        pool = pools.get('authentication_pool')
-                    elif self.f.__name__ in events_funcs:
-                        pool = pools.get('events_pool')
-                    else:
-                        pool = pools.get('process_pool')
-
                     task = loop.run_in_executor(
-                        pool,
+                        self.pool,
                         partial(
                             self.run_local,
                             self.f,
@@ -312,7 +478,11 @@ class DistributedAPI:
                     )
                 try:
                     self.debug_log('Starting to execute request locally')
-                    data = await asyncio.wait_for(task, timeout=timeout)
+                    if timeout is None:
+                        # asyncio.wait_for without a timeout still schedules an extra wrapper task.
+                        data = await task
+                    else:
+                        data = await asyncio.wait_for(task, timeout=timeout)
                     self.debug_log('Finished executing request locally')
                 except asyncio.TimeoutError:
                     raise exception.WazuhInternalError(3021)
@@ -325,7 +495,7 @@ class DistributedAPI:
             except process.BrokenProcessPool:
                 raise exception.WazuhInternalError(900)
 
-            self.debug_log(f'Time calculating request result: {time.time() - before:.3f}s')
+            self.debug_log('Time calculating request result: %.3fs', time.time() - before)
             return data
         except exception.WazuhInternalError as e:
             e.dapi_errors = await self.get_error_info(e)
@@ -423,10 +593,7 @@ class DistributedAPI:
         # POST/agent/group/:group_id/configuration and POST/agent/group/:group_id/file/:file_name API calls write
         # a temporary file in /var/ossec/tmp which needs to be sent to the master before forwarding the request
         client = self.get_client()
-        json.loads(
-            await client.send_file(os.path.join(common.WAZUH_PATH, self.f_kwargs['tmp_file']), node_name),
-            object_hook=c_common.as_wazuh_object,
-        )
+        _loads(await client.send_file(os.path.join(common.WAZUH_PATH, self.f_kwargs['tmp_file']), node_name))
         os.remove(os.path.join(common.WAZUH_PATH, self.f_kwargs['tmp_file']))
 
     async def execute_remote_request(self) -> Dict:
@@ -441,10 +608,8 @@ class DistributedAPI:
             await self.send_tmp_file()
 
         client = self.get_client()
-        node_response = await client.execute(
-            command=b'dapi', data=json.dumps(self.to_dict(), cls=c_common.WazuhJSONEncoder).encode()
-        )
-        return json.loads(node_response, object_hook=c_common.as_wazuh_object)
+        node_response = await client.execute(command=b'dapi', data=_dumps(self.to_dict()))
+        return _loads(node_response)
 
     async def forward_request(self) -> [wresults.AbstractWazuhResult, exception.WazuhException]:
         """Forward a request to the node who has all available information to answer it.
@@ -481,17 +646,23 @@ class DistributedAPI:
                     await self.send_tmp_file(node_name)
                 client = self.get_client()
                 try:
-                    kcopy = deepcopy(self.to_dict())
                     if agent_list is not None and set(self.f_kwargs) & {'agent_id', 'agent_list'}:
-                        kcopy['f_kwargs']['agent_id' if 'agent_id' in kcopy['f_kwargs'] else 'agent_list'] = agent_list
+                        request = dict(base_request)
+                        request['f_kwargs'] = {
+                            **self.f_kwargs,
+                            'agent_id' if 'agent_id' in self.f_kwargs else 'agent_list': agent_list,
+                        }
+                        payload = _dumps(request)
+                    else:
+                        payload = base_payload
 
-                    result = json.loads(
-                        await client.execute(
-                            b'dapi_fwd',
-                            '{} {}'.format(node_name, json.dumps(kcopy, cls=c_common.WazuhJSONEncoder)).encode(),
-                        ),
-                        object_hook=c_common.as_wazuh_object,
-                    )
+                    node_response = await client.execute(b'dapi_fwd', b' '.join((node_name.encode(), payload)))
+                    if raw_passthrough:
+                        raw = node_response.encode() if isinstance(node_response, str) else node_response
+                        # In-band exceptions must still be deserialized so they get the usual treatment.
+                        result = raw if b'__wazuh_exception__' not in raw else _loads(node_response)
+                    else:
+                        result = _loads(node_response)
                 except WazuhClusterError as e:
                     if e.code == 3022:
                         result = e
@@ -512,7 +683,7 @@ class DistributedAPI:
 
             return (
                 result
-                if isinstance(result, (wresults.AbstractWazuhResult, exception.WazuhException))
+                if isinstance(result, (bytes, wresults.AbstractWazuhResult, exception.WazuhException))
                 else wresults.WazuhResult(result)
             )
 
@@ -552,6 +723,9 @@ class DistributedAPI:
         # get the node(s) who has all available information to answer the request.
         nodes = await self.get_solver_node()
         self.from_cluster = True
+        # The request is now marked as forwarded, so re-dispatching it (local execution branch of forward)
+        # must run it locally instead of forwarding again.
+        self._dispatch = self._pick_dispatch()
         common.rbac.set(self.rbac_permissions)
         common.cluster_nodes.set(self.nodes)
         common.broadcast.set(self.broadcasting)
@@ -577,20 +751,49 @@ class DistributedAPI:
             allowed_nodes.affected_items = list(nodes)
             allowed_nodes.total_affected_items = len(allowed_nodes.affected_items)
 
+        async def forward_all() -> [wresults.AbstractWazuhResult, exception.WazuhException]:
+            """Forward the request to every node, merging each response as soon as it arrives.
+
+            Merging incrementally overlaps the merge CPU with the in-flight RPCs instead of waiting
+            for the slowest node, and avoids retaining every per-node response until the end.
+
+            Returns
+            -------
+            wresults.AbstractWazuhResult or exception.WazuhException
+            """
+            merged = None
+            for forwarded in asyncio.as_completed([forward(node) for node in cleaned_valid_nodes]):
+                result = await forwarded
+                merged = result if merged is None else merged | result
+            return merged
+
+        # The request envelope is identical for every node except, at most, the forwarded agent list, so it is
+        # serialized once up front and only re-serialized for nodes that need a different agent list.
+        base_request = self.to_dict()
+        base_payload = _dumps(base_request)
+
         cleaned_valid_nodes = await clean_valid_nodes(valid_nodes)
 
-        response = await asyncio.shield(asyncio.gather(*[forward(node) for node in cleaned_valid_nodes]))
+        # With a single remote solver node and no failed items to merge in, the worker's response would be
+        # deserialized here just so the caller can serialize it again. In that case keep it as raw bytes.
+        raw_passthrough = (
+            self.allow_raw_response
+            and len(cleaned_valid_nodes) == 1
+            and cleaned_valid_nodes[0][0] != self.node_info['node']
+            and not allowed_nodes.failed_items
+        )
 
-        if allowed_nodes.total_affected_items > 1:
-            response = reduce(or_, response)
-            if isinstance(response, wresults.AbstractWazuhResult):
-                response = response.limit(
-                    limit=self.f_kwargs.get('limit', common.DATABASE_LIMIT), offset=self.f_kwargs.get('offset', 0)
-                ).sort(fields=self.f_kwargs.get('fields', []), order=self.f_kwargs.get('order', 'asc'))
-        elif response:
-            response = response[0]
-        else:
+        response = await asyncio.shield(forward_all()) if cleaned_valid_nodes else None
+
+        if isinstance(response, bytes):
+            return response
+
+        if response is None:
             response = deepcopy(allowed_nodes)
+        elif allowed_nodes.total_affected_items > 1 and isinstance(response, wresults.AbstractWazuhResult):
+            response = response.limit(
+                limit=self.f_kwargs.get('limit', common.DATABASE_LIMIT), offset=self.f_kwargs.get('offset', 0)
+            ).sort(fields=self.f_kwargs.get('fields', []), order=self.f_kwargs.get('order', 'asc'))
 
         # It might be a WazuhError after reducing
         if isinstance(response, wresults.AffectedItemsWazuhResult):
@@ -628,10 +831,20 @@ class DistributedAPI:
             else:
                 filters = None
 
-            system_agents = agent.Agent.get_agents_overview(select=select_node, limit=None, filters=filters)['items']
+            if filters is not None and 'id' in filters:
+                # Repeated fan-outs for the same agent set reuse the cached mapping instead of scanning the DB.
+                agent_pairs = _get_agents_node_map(tuple(sorted(requested_agents)))
+            else:
+                system_agents = agent.Agent.get_agents_overview(select=select_node, limit=None, filters=filters)[
+                    'items'
+                ]
+                agent_pairs = ((element.get('node_name', ''), element['id']) for element in system_agents)
+
             node_name = defaultdict(list)
-            for element in system_agents:
-                node_name[element.get('node_name', '')].append(element['id'])
+            system_ids = set()
+            for node, agent_id in agent_pairs:
+                node_name[node].append(agent_id)
+                system_ids.add(agent_id)
 
             # Update node_name in case it is empty or a node has no agents
             if 'node_id' in self.f_kwargs:
@@ -640,7 +853,7 @@ class DistributedAPI:
 
             if requested_agents != '*':  # When all agents are requested cannot be non existent ids
                 # Add non existing ids in the master's dictionary entry
-                non_existent_ids = list(set(requested_agents) - set(map(operator.itemgetter('id'), system_agents)))
+                non_existent_ids = list(set(requested_agents) - system_ids)
                 if non_existent_ids:
                     if self.node_info['node'] in node_name:
                         node_name[self.node_info['node']].extend(non_existent_ids)
@@ -659,30 +872,60 @@ class DistributedAPI:
             else:
                 # agents, syscheck and syscollector
                 # API calls that affect all agents. For example, PUT/agents/restart, etc...
-                agents = agent.Agent.get_agents_overview(
-                    select=select_node, limit=None, sort={'fields': ['node_name'], 'order': 'desc'}
-                )['items']
-                node_name = {k: [] for k, _ in itertools.groupby(agents, key=operator.itemgetter('node_name'))}
+                node_name = {node: [] for node in _get_system_nodes_cached()}
             return node_name
 
 
+# Maximum number of extra pending requests drained from the queue per loop turn to be dispatched concurrently.
+_REQUEST_DRAIN_LIMIT = 16
+
+
 class WazuhRequestQueue:
     """Represents a queue of Wazuh requests."""
 
     def __init__(self, server):
-        self.request_queue = asyncio.Queue()
+        self.request_queue = asyncio.Queue(maxsize=server.server_config.communications.queue.dapi_max_size)
         self.server = server
+        # Strong references to in-flight error-reply tasks: the event loop only keeps weak ones, so an
+        # unreferenced task could be garbage-collected before it runs.
+        self._pending_tasks = set()
 
     def add_request(self, request: bytes):
         """Add a request to the queue.
 
+        If the queue is full the request is discarded and the requesting node is answered with an error right
+        away, instead of letting it wait until its request timeout expires.
+
         Parameters
         ----------
         request : bytes
             Request to add.
         """
-        self.logger.debug(f'Received request: {request}')
-        self.request_queue.put_nowait(request.decode())
+        self.logger.debug('Received request: %s', request)
+        request = request.decode()
+        try:
+            self.request_queue.put_nowait(request)
+        except asyncio.QueueFull:
+            self.logger.error('Request queue is full. Discarding request.')
+            task = asyncio.create_task(self.answer_discarded_request(request))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+
+    async def answer_discarded_request(self, request: str):
+        """Send an error response for a request discarded because the queue was full.
+
+        Parameters
+        ----------
+        request : str
+            Discarded request, in the same format accepted by `add_request`.
+        """
+        names = request.split(' ', 1)[0].split('*', 1)
+        name_2 = b'' if len(names) == 1 else names[1].encode() + b' '
+        try:
+            node = self.server.client if names[0] == 'master' else self.server.clients[names[0]]
+            await node.send_request(b'dapi_err', name_2 + b'Request queue is full')
+        except Exception as e:
+            self.logger.error(f'Error answering discarded request: {e}')
 
 
 class APIRequestQueue(WazuhRequestQueue):
@@ -697,37 +940,59 @@ class APIRequestQueue(WazuhRequestQueue):
 
     async def run(self):
         while True:
-            names, request = (await self.request_queue.get()).split(' ', 1)
-            names = names.split('*', 1)
-            # name    -> node name the request must be sent to. None if called from a worker node.
-            # id      -> id of the request.
-            # request -> JSON containing request's necessary information
-            name_2 = '' if len(names) == 1 else names[1] + ' '
-
-            # Get reference to MasterHandler or WorkerHandler
-            try:
-                node = self.server.client if names[0] == 'master' else self.server.clients[names[0]]
-            except KeyError as e:
-                self.logger.error(
-                    f'Error in DAPI request. The destination node is not connected or does not exist: {e}.'
-                )
-                continue
+            requests = [await self.request_queue.get()]
+            # Opportunistically drain a few more pending requests so a burst is parsed and dispatched
+            # concurrently instead of paying a full loop turn per request.
+            while len(requests) < _REQUEST_DRAIN_LIMIT:
+                try:
+                    requests.append(self.request_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
 
-            try:
-                request = json.loads(request, object_hook=c_common.as_wazuh_object)
-                self.logger.info(
-                    'Receiving request: {} from {}'.format(
-                        request['f'].__name__, names[0] if not name_2 else '{} ({})'.format(names[0], names[1])
-                    )
-                )
-                result = await DistributedAPI(**request, logger=self.logger, node=node).distribute_function()
-                task_id = await node.send_string(json.dumps(result, cls=c_common.WazuhJSONEncoder).encode())
-            except Exception as e:
-                self.logger.error(f'Error in distributed API: {e}', exc_info=True)
-                with contextlib.suppress(Exception):
-                    await node.send_request(b'dapi_err', f'{name_2}{str(e)}'.encode())
+            if len(requests) == 1:
+                await self.process_request(requests[0])
             else:
-                try:
-                    await node.send_request(b'dapi_res', name_2.encode() + task_id)
-                except WazuhException as e:
-                    self.logger.error(e.message, exc_info=False)
+                await asyncio.gather(*map(self.process_request, requests))
+
+    async def process_request(self, request: str):
+        """Answer a single DAPI request and send the result back to the requesting node.
+
+        Parameters
+        ----------
+        request : str
+            Request to process, as pushed into the queue by `add_request`.
+        """
+        names, request = request.split(' ', 1)
+        names = names.split('*', 1)
+        # name    -> node name the request must be sent to. None if called from a worker node.
+        # id      -> id of the request.
+        # request -> JSON containing request's necessary information
+        name_2 = b'' if len(names) == 1 else names[1].encode() + b' '
+
+        # Get reference to MasterHandler or WorkerHandler
+        try:
+            node = self.server.client if names[0] == 'master' else self.server.clients[names[0]]
+        except KeyError as e:
+            self.logger.error(f'Error in DAPI request. The destination node is not connected or does not exist: {e}.')
+            return
+
+        try:
+            request = _loads(request)
+            self.logger.info(
+                'Receiving request: {} from {}'.format(
+                    request['f'].__name__, names[0] if not name_2 else '{} ({})'.format(names[0], names[1])
+                )
+            )
+            result = await DistributedAPI(
+                **request, logger=self.logger, node=node, allow_raw_response=True
+            ).distribute_function()
+            task_id = await node.send_string(result if isinstance(result, bytes) else _dumps(result))
+        except Exception as e:
+            self.logger.error(f'Error in distributed API: {e}', exc_info=True)
+            with contextlib.suppress(Exception):
+                await node.send_request(b'dapi_err', name_2 + str(e).encode())
+        else:
+            try:
+                await node.send_request(b'dapi_res', name_2 + task_id)
+            except WazuhException as e:
+                self.logger.error(e.message, exc_info=False)
@@ -2,6 +2,7 @@
 # Created by Wazuh, Inc. <info@wazuh.com>.
 # This program is free software; you can redistribute it and/or modify it under the terms of GPLv2
 
+import asyncio
 import json
 import logging
 import os
@@ -16,23 +17,25 @@ from connexion import ProblemException
 from sqlalchemy.exc import OperationalError
 from wazuh.core import common
 
-sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '../../../../../../api'))
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.realpath(__file__)), '../../../../../../apis/server_management')
+)
 
 with patch('wazuh.common.wazuh_uid'):
     with patch('wazuh.common.wazuh_gid'):
-        with patch('wazuh.core.utils.load_wazuh_xml'):
-            sys.modules['wazuh.rbac.orm'] = MagicMock()
-            import wazuh.rbac.decorators
+        sys.modules['wazuh.rbac.orm'] = MagicMock()
+        import wazuh.rbac.decorators
 
-            del sys.modules['wazuh.rbac.orm']
+        del sys.modules['wazuh.rbac.orm']
 
-            from wazuh.tests.util import RBAC_bypasser
+        from wazuh.tests.util import RBAC_bypasser
 
         wazuh.rbac.decorators.expose_resources = RBAC_bypasser
         from server_management_api.util import raise_if_exc
         from wazuh import WazuhError, WazuhInternalError, agent, cluster, manager
         from wazuh.core.cluster import local_client
-        from wazuh.core.cluster.dapi.dapi import APIRequestQueue, DistributedAPI
+        from wazuh.core.cluster.common import WazuhJSONEncoder
+        from wazuh.core.cluster.dapi.dapi import APIRequestQueue, DistributedAPI, clear_dapi_caches
         from wazuh.core.exception import WazuhClusterError
         from wazuh.core.manager import get_manager_status
         from wazuh.core.results import AffectedItemsWazuhResult, WazuhResult
@@ -42,10 +45,11 @@ logger = logging.getLogger('wazuh')
 DEFAULT_REQUEST_TIMEOUT = 10
 
 
-@pytest.fixture(scope='module', autouse=True)
-def path_get_cluset_items():
-    with patch('wazuh.core.cluster.utils.get_cluster_items'):
-        yield
+@pytest.fixture(autouse=True)
+def reset_dapi_caches():
+    """Clear the dapi module TTL caches so values cached under one test's patches do not leak into the next."""
+    clear_dapi_caches()
+    yield
 
 
 async def raise_if_exc_routine(dapi_kwargs, expected_error=None):
@@ -80,13 +84,13 @@ class TestingLogger:
         self.handlers = []
         self.parent = TestingLoggerParent()
 
-    def error(self, message):
+    def error(self, message, *args, **kwargs):
         pass
 
-    def debug(self, message):
+    def debug(self, message, *args):
         pass
 
-    def debug2(self, message):
+    def debug2(self, message, *args):
         pass
 
 
@@ -415,6 +419,49 @@ async def test_DistributedAPI_forward_request_errors(mock_client_execute, mock_g
     await raise_if_exc_routine(dapi_kwargs=dapi_kwargs, expected_error=3036)
 
 
+@patch('wazuh.core.cluster.cluster.get_node', return_value={'type': 'master', 'node': 'master-node'})
+@patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.get_solver_node', new=AsyncMock(return_value={'worker1': []}))
+@patch('wazuh.core.cluster.local_client.LocalClient.execute', new=AsyncMock(return_value='{"items": [1]}'))
+async def test_DistributedAPI_forward_request_raw_passthrough(mock_get_node):
+    """Check that a forward to a single remote node returns the serialized response unchanged when allowed."""
+    dapi = DistributedAPI(
+        f=agent.restart_agents, logger=logger, request_type='distributed_master', allow_raw_response=True
+    )
+    assert await dapi.distribute_function() == b'{"items": [1]}'
+
+    # Without allow_raw_response the same response must be deserialized and wrapped as usual
+    dapi = DistributedAPI(f=agent.restart_agents, logger=logger, request_type='distributed_master')
+    assert await dapi.distribute_function() == WazuhResult({'items': [1]})
+
+
+@patch('wazuh.core.cluster.cluster.get_node', return_value={'type': 'master', 'node': 'master-node'})
+@patch(
+    'wazuh.core.cluster.dapi.dapi.DistributedAPI.get_solver_node',
+    new=AsyncMock(return_value={'worker1': [], 'worker2': []}),
+)
+@patch('wazuh.core.cluster.local_client.LocalClient.execute', new=AsyncMock(return_value='{"items": [1]}'))
+async def test_DistributedAPI_forward_request_raw_passthrough_multiple_nodes(mock_get_node):
+    """Check that forwards to more than one node keep merging deserialized responses."""
+    dapi = DistributedAPI(
+        f=agent.restart_agents, logger=logger, request_type='distributed_master', allow_raw_response=True
+    )
+    assert await dapi.distribute_function() == WazuhResult({'items': [1]})
+
+
+@patch('wazuh.core.cluster.cluster.get_node', return_value={'type': 'master', 'node': 'master-node'})
+@patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.get_solver_node', new=AsyncMock(return_value={'worker1': []}))
+async def test_DistributedAPI_forward_request_raw_passthrough_exception(mock_get_node):
+    """Check that in-band exceptions are still deserialized on the raw passthrough path."""
+    payload = json.dumps(WazuhError(1017), cls=WazuhJSONEncoder)
+    with patch('wazuh.core.cluster.local_client.LocalClient.execute', new=AsyncMock(return_value=payload)):
+        dapi = DistributedAPI(
+            f=agent.restart_agents, logger=logger, request_type='distributed_master', allow_raw_response=True
+        )
+        response = await dapi.distribute_function()
+        assert isinstance(response, WazuhError)
+        assert response.code == 1017
+
+
 @patch(
     'wazuh.core.cluster.dapi.dapi.DistributedAPI.execute_local_request',
     new=AsyncMock(side_effect=WazuhInternalError(1001)),
@@ -638,6 +685,58 @@ def test_APIRequestQueue_init(queue_mock):
     queue_mock.assert_called_once()
 
 
+async def test_WazuhRequestQueue_add_request_full():
+    """Check that requests over the queue limit are discarded and the caller is answered with an error."""
+
+    class NodeMock:
+        def __init__(self):
+            self.requests = []
+
+        async def send_request(self, command, data):
+            self.requests.append((command, data))
+
+    node = NodeMock()
+    server = MagicMock()
+    server.server_config.communications.queue.dapi_max_size = 1
+    server.clients = {'worker1': node}
+    request_queue = APIRequestQueue(server=server)
+
+    request_queue.add_request(b'worker1*id1 {"request": 1}')
+    request_queue.add_request(b'worker1*id2 {"request": 2}')
+    await asyncio.sleep(0)
+
+    assert request_queue.request_queue.qsize() == 1
+    assert node.requests == [(b'dapi_err', b'id2 Request queue is full')]
+
+
+async def test_APIRequestQueue_run_drains_pending_requests():
+    """Check that `run` dispatches a burst of queued requests in a single batch."""
+
+    class RequestQueueMock:
+        def __init__(self):
+            self.pending = ['req1', 'req2']
+
+        async def get(self):
+            if not self.pending:
+                raise Exception('break while true')
+            return self.pending.pop(0)
+
+        def get_nowait(self):
+            if not self.pending:
+                raise asyncio.QueueEmpty
+            return self.pending.pop(0)
+
+    server = MagicMock()
+    server.server_config.communications.queue.dapi_max_size = 1024
+    apirequest = APIRequestQueue(server=server)
+    apirequest.request_queue = RequestQueueMock()
+
+    with patch.object(APIRequestQueue, 'process_request', new_callable=AsyncMock) as process_mock:
+        with pytest.raises(Exception, match='.*break while true.*'):
+            await apirequest.run()
+        process_mock.assert_has_calls([call('req1'), call('req2')], any_order=True)
+
+
 @patch('wazuh.core.cluster.common.import_module', return_value='os.path')
 @patch('asyncio.get_event_loop')
 async def test_APIRequestQueue_run(loop_mock, import_module_mock):
@@ -660,6 +759,8 @@ async def test_APIRequestQueue_run(loop_mock, import_module_mock):
     class ServerMock:
         def __init__(self):
             self.clients = {'names': ['w1', 'w2']}
+            self.server_config = MagicMock()
+            self.server_config.communications.queue.dapi_max_size = 1024
 
     class RequestQueueMock:
         async def get(self):
@@ -668,6 +769,9 @@ async def test_APIRequestQueue_run(loop_mock, import_module_mock):
                 '{"f": {"__callable__": {"__name__": "join", "__qualname__": "join", "__module__": "join"}}}'
             )
 
+        def get_nowait(self):
+            raise asyncio.QueueEmpty
+
     with patch.object(logger, 'error', side_effect=Exception('break while true')) as logger_mock:
         server = ServerMock()
         apirequest = APIRequestQueue(server=server)
@@ -10,7 +10,7 @@ import os
 import shutil
 from collections import defaultdict
 from time import perf_counter
-from typing import Callable, Dict, List, Tuple, Union
+from typing import Callable, Coroutine, Dict, List, Tuple, Union
 
 from wazuh.core import cluster as metadata
 from wazuh.core import common, exception, utils
@@ -564,7 +564,7 @@ class Worker(client.AbstractClientManager):
         self.dapi = dapi.APIRequestQueue(server=self)
         self.integrity_control = {}
 
-    def add_tasks(self) -> List[Tuple[asyncio.coroutine, Tuple]]:
+    def add_tasks(self) -> List[Tuple[Coroutine, Tuple]]:
         """Define the tasks that the worker will always run in an infinite loop.
 
         Returns
@@ -179,7 +179,9 @@ try:
     )
 # Handle exception when the user running Wazuh cannot access /dev/shm.
 except (FileNotFoundError, PermissionError):
-    mp_pools: ContextVar[Dict] = ContextVar('mp_pools', default={'thread_pool': ThreadPoolExecutor(max_workers=1)})
+    mp_pools: ContextVar[Dict] = ContextVar(
+        'mp_pools', default={'thread_pool': ThreadPoolExecutor(max_workers=1, thread_name_prefix='wazuh-pool')}
+    )
 _context_cache = dict()
 
 
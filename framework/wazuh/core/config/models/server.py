@@ -125,6 +125,18 @@ class CommunicationsTimeoutConfig(WazuhConfigBaseModel):
     receiving_file: PositiveInt = 120
 
 
+class CommunicationsQueueConfig(WazuhConfigBaseModel):
+    """Configuration for communication queues.
+
+    Parameters
+    ----------
+    dapi_max_size : PositiveInt
+        The maximum number of pending DAPI requests in the queue. Default is 1024.
+    """
+
+    dapi_max_size: PositiveInt = 1024
+
+
 class CommunicationsConfig(WazuhConfigBaseModel):
     """Configuration for communications settings.
 
@@ -134,10 +146,13 @@ class CommunicationsConfig(WazuhConfigBaseModel):
         Configuration for zip settings.
     timeouts : CommunicationsTimeoutConfig
         Configuration for communication timeouts.
+    queue : CommunicationsQueueConfig
+        Configuration for communication queues.
     """
 
     zip: ZipConfig = ZipConfig()
     timeouts: CommunicationsTimeoutConfig = CommunicationsTimeoutConfig()
+    queue: CommunicationsQueueConfig = CommunicationsQueueConfig()
 
 
 class WorkerIntervalsConfig(WazuhConfigBaseModel):
@@ -5,6 +5,7 @@ from pydantic import ValidationError
 from wazuh.core.config.models.server import (
     DEFAULT_CTI_URL,
     CommunicationsConfig,
+    CommunicationsQueueConfig,
     CommunicationsTimeoutConfig,
     CTIConfig,
     JWTConfig,
@@ -212,10 +213,37 @@ def test_communications_timeout_config_invalid_values(values):
 @pytest.mark.parametrize(
     'init_values, expected',
     [
-        ({}, {'zip': {}, 'timeouts': {}}),
+        ({}, {'dapi_max_size': 1024}),
+        ({'dapi_max_size': 256}, {'dapi_max_size': 256}),
+    ],
+)
+def test_communications_queue_config_default_values(init_values, expected):
+    """Check the correct initialization of the `CommunicationsQueueConfig` class."""
+    config = CommunicationsQueueConfig(**init_values)
+
+    assert config.dapi_max_size == expected['dapi_max_size']
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        {'dapi_max_size': 0},
+        {'dapi_max_size': -20},
+    ],
+)
+def test_communications_queue_config_invalid_values(values):
+    """Check the correct behavior of the `CommunicationsQueueConfig` class validations."""
+    with pytest.raises(ValidationError):
+        _ = CommunicationsQueueConfig(**values)
+
+
+@pytest.mark.parametrize(
+    'init_values, expected',
+    [
+        ({}, {'zip': {}, 'timeouts': {}, 'queue': {}}),
         (
-            {'zip': {'max_size': 40}, 'timeouts': {'dapi_request': 100}},
-            {'zip': {'max_size': 40}, 'timeouts': {'dapi_request': 100}},
+            {'zip': {'max_size': 40}, 'timeouts': {'dapi_request': 100}, 'queue': {'dapi_max_size': 256}},
+            {'zip': {'max_size': 40}, 'timeouts': {'dapi_request': 100}, 'queue': {'dapi_max_size': 256}},
         ),
     ],
 )
@@ -225,6 +253,7 @@ def test_communications_config_default_values(init_values, expected):
 
     assert config.zip == ZipConfig(**expected['zip'])
     assert config.timeouts == CommunicationsTimeoutConfig(**expected['timeouts'])
+    assert config.queue == CommunicationsQueueConfig(**expected['queue'])
 
 
 @pytest.mark.parametrize(
@@ -4,6 +4,7 @@
 
 import builtins
 import collections
+import heapq
 import re
 import sys
 from copy import deepcopy
@@ -76,6 +77,15 @@ class AbstractWazuhResult(collections.abc.MutableMapping):
     def __ne__(self, other):
         return not self == other
 
+    # Handler names (not bound methods) so subclasses redefining any `_merge_*` method are honoured.
+    _MERGE_HANDLERS = {
+        dict: '_merge_dict',
+        list: '_merge_list',
+        int: '_merge_number',
+        float: '_merge_number',
+        str: '_merge_str',
+    }
+
     def __or__(self, other):
         """| operator used to merge two AbstractWazuhResult objects. When merged with a WazuhException, the result is
         always a WazuhException.
@@ -104,11 +114,16 @@ class AbstractWazuhResult(collections.abc.MutableMapping):
         for key, field in other.items():
             if key not in result:
                 result[key] = field
+                continue
+            # Exact-type dispatch resolves the handler with a single dict lookup; subclasses and other
+            # Number types fall back to the isinstance chain.
+            handler = self._MERGE_HANDLERS.get(type(field))
+            if handler is not None:
+                result[key] = getattr(self, handler)(result[key], field, key=key)
             elif isinstance(field, dict):
                 result[key] = self._merge_dict(result[key], field, key=key)
             elif isinstance(field, list):
-                self_field = result[key]
-                result[key] = self._merge_list(self_field, field, key=key)
+                result[key] = self._merge_list(result[key], field, key=key)
             elif isinstance(field, Number):
                 result[key] = self._merge_number(result[key], field, key=key)
             elif isinstance(field, str):  # str
@@ -140,6 +155,10 @@ class AbstractWazuhResult(collections.abc.MutableMapping):
         """Merge two list objects when merging two results by concatenating them. This method may be redefined in
         subclasses.
 
+        Elements already present in `self_field` are skipped. Membership is checked against a set so merging
+        large lists does not scan `self_field` once per element; unhashable elements (i.e. dicts) keep the
+        previous linear scan.
+
         Parameters
         ----------
         self_field : list
@@ -154,7 +173,27 @@ class AbstractWazuhResult(collections.abc.MutableMapping):
         list
             Resultant list.
         """
-        return [*self_field, *[elem for elem in other_field if elem not in self_field]]
+        if not isinstance(self_field, list):
+            # Deliberate guard: the set-based path below would happily iterate any iterable, so a str
+            # merged with a list (mismatched field types across nodes) would be exploded into characters.
+            # Fall back to plain concatenation, which raises TypeError for such mismatches.
+            return self_field + [elem for elem in other_field if elem not in self_field]
+
+        try:
+            seen = set(self_field)
+        except TypeError:
+            return [*self_field, *[elem for elem in other_field if elem not in self_field]]
+
+        result = list(self_field)
+        for elem in other_field:
+            try:
+                if elem not in seen:
+                    result.append(elem)
+            except TypeError:
+                if elem not in self_field:
+                    result.append(elem)
+
+        return result
 
     def _merge_number(self, self_field: int, other_field: int, key: str = None) -> int:
         """Merge two numeric objects when merging two results by adding them. This method may be redefined in
@@ -664,62 +703,53 @@ class AffectedItemsWazuhResult(AbstractWazuhResult):
         dict
             Return AffectedItemsWazuhResult as a dictionary with fields data, message and error.
         """
+        if self.failed_items:
+            failed_items = [
+                {
+                    'error': {'code': exc.code, 'message': exc.message}
+                    | ({'remediation': exc.remediation} if exc.remediation is not None else {}),
+                    'id': _sort_ids(ids),
+                }
+                for exc, ids in sorted(self.failed_items.items(), key=lambda x: x[0].code)
+            ]
+        else:
+            # Hot path: fully successful results have no failed items to sort or format.
+            failed_items = []
 
-        def sort_ids(ids: list) -> list:
-            """Sort list of IDS.
-
-            Parameters
-            ----------
-            ids : list
-                List of IDs to sort.
+        # Error code: 0 complete, 1 failed, 2 partial.
+        if self.total_failed_items > 0:
+            error = 2 if self.total_affected_items > 0 else 1
+        else:
+            error = 0
 
-            Returns
-            -------
-            list
-                Sorted list.
-            """
-            try:
-                return sorted(list(ids), key=int)
-            except ValueError:
-                return sorted(list(ids))
-
-        def set_error_code() -> int:
-            """Set error code (0, 1 or 2) depending on the affected and failed items.
-
-            Returns
-            -------
-            int
-                Error code.
-            """
-            complete = 0
-            failed = 1
-            partial = 2
-
-            if self.total_affected_items > 0 and self.total_failed_items > 0:
-                return partial
-            elif self.total_affected_items > 0:
-                return complete
-            elif self.total_failed_items > 0:
-                return failed
-            return complete
-
-        ordered_failed_items = sorted(self.failed_items.items(), key=lambda x: x[0].code)
         result = {
             'affected_items': self.affected_items,
             'total_affected_items': self.total_affected_items,
             'total_failed_items': self.total_failed_items,
-            'failed_items': [
-                {
-                    'error': {'code': exc.code, 'message': exc.message}
-                    | ({'remediation': exc.remediation} if exc.remediation is not None else {}),
-                    'id': sort_ids(ids),
-                }
-                for exc, ids in ordered_failed_items
-            ],
+            'failed_items': failed_items,
             **self.dikt,
         }
 
-        return {'data': result, 'message': self.message, 'error': set_error_code()}
+        return {'data': result, 'message': self.message, 'error': error}
+
+
+def _sort_ids(ids: Iterable) -> list:
+    """Sort a collection of failed-item IDs, numerically when possible.
+
+    Parameters
+    ----------
+    ids : Iterable
+        IDs to sort.
+
+    Returns
+    -------
+    list
+        Sorted list.
+    """
+    try:
+        return sorted(ids, key=int)
+    except ValueError:
+        return sorted(ids)
 
 
 def nested_itemgetter(*expressions):
@@ -812,6 +842,20 @@ def _goes_before_than(
     return False
 
 
+class _MergeKey:
+    """Sort key adapting `_goes_before_than` to the `<` operator expected by `heapq.merge`."""
+
+    __slots__ = ('values', 'ascending', 'casters')
+
+    def __init__(self, values: list, ascending: Union[tuple, list], casters: Iterable):
+        self.values = values
+        self.ascending = ascending
+        self.casters = casters
+
+    def __lt__(self, other) -> bool:
+        return _goes_before_than(self.values, other.values, ascending=self.ascending, casters=self.casters)
+
+
 def merge(
     *iterables,
     criteria: Union[tuple, list] = None,
@@ -820,6 +864,9 @@ def merge(
 ) -> Iterable:
     """Merge iterables in a single one assuming they are already ordered according to criteria, ascending and types.
 
+    A k-way heap merge compares each element against O(log k) candidates instead of scanning the head of every
+    iterable once per emitted element. The input iterables are not modified.
+
     Parameters
     ----------
     iterables
@@ -837,24 +884,13 @@ def merge(
     Iterable
         A new sorted iterable.
     """
-    result = list()
-    final_len = sum([len(iterable) for iterable in iterables])
     if criteria is None:
         getters = [lambda x: x]  # Init dummy itemgetter
     else:
         getters = [nested_itemgetter(criterion) for criterion in criteria]
     casters = [getattr(builtins, type_) for type_ in types]
-    while len(result) < final_len:
-        selected = None
-        for i, iterable in enumerate(iterables):
-            if len(iterable) > 0:
-                if selected is None:
-                    selected = i
-                else:
-                    candidate = [getter(iterable[0]) for getter in getters]
-                    selected_candidate = [getter(iterables[selected][0]) for getter in getters]
-                    if _goes_before_than(candidate, selected_candidate, ascending=ascending, casters=casters):
-                        selected = i
-        result.append(iterables[selected].pop(0))
-
-    return result
+
+    def sort_key(item) -> _MergeKey:
+        return _MergeKey([getter(item) for getter in getters], ascending, casters)
+
+    return list(heapq.merge(*iterables, key=sort_key))
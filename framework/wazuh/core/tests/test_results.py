@@ -15,6 +15,8 @@ with patch('wazuh.core.common.wazuh_uid'):
             AffectedItemsWazuhResult,
             WazuhResult,
             _goes_before_than,
+            _MergeKey,
+            _sort_ids,
             merge,
             nested_itemgetter,
         )
@@ -274,6 +276,42 @@ def test_results_AffectedItemsWazuhResult__merge_str(self_field, other_field, ke
     assert merge_result == expected_result
 
 
+@pytest.mark.parametrize(
+    'self_field, other_field, expected_result',
+    [
+        (['001', '002'], ['002', '003'], ['001', '002', '003']),
+        ([], ['001'], ['001']),
+        (['001'], [{'id': '002'}, '001'], ['001', {'id': '002'}]),
+        ([{'id': '001'}], [{'id': '001'}, {'id': '002'}], [{'id': '001'}, {'id': '002'}]),
+    ],
+)
+def test_results_AffectedItemsWazuhResult__merge_list(self_field, other_field, expected_result):
+    """Test method `_merge_list` from class `AffectedItemsWazuhResult`.
+
+    Parameters
+    ----------
+    self_field : list
+        List in the left item of the merge. May contain unhashable elements to force the linear fallback.
+    other_field : list
+        List in the right item of the merge.
+    expected_result : list
+        Expected result after the method call.
+    """
+    affected_result = AffectedItemsWazuhResult()
+    assert affected_result._merge_list(self_field, other_field) == expected_result
+
+
+def test_results_AffectedItemsWazuhResult__merge_list_type_mismatch():
+    """Test method `_merge_list` from class `AffectedItemsWazuhResult` with mismatched field types.
+
+    Merging a non-list field (e.g. a str coming from a node with a different schema) must keep raising
+    TypeError instead of silently iterating it.
+    """
+    affected_result = AffectedItemsWazuhResult()
+    with pytest.raises(TypeError):
+        affected_result._merge_list('sample', ['sample'])
+
+
 def test_results_AffectedItemsWazuhResult_encode_decode_json(get_wazuh_affected_item):
     """Test methods `encode_json` and `decode_json` from class `AffectedItemsWazuhResult`."""
     param_list = [['001', '002'], 2, None, ['int'], [True, True], 'Sample message', 'Sample message', 'Sample message']
@@ -360,6 +398,55 @@ def test_results__goes_before_than(a, b, ascending, casters, expected_result):
     assert _goes_before_than(a, b, ascending=ascending, casters=casters) == expected_result
 
 
+@pytest.mark.parametrize(
+    'a, b, ascending, casters, expected_result',
+    [
+        (['001'], ['002'], [True], [int], True),
+        (['001'], ['002'], [False], [int], False),
+        ([None], ['002'], [True], [str], True),
+        (['002'], ['002'], [True], [int], False),
+    ],
+)
+def test_results__MergeKey(a, b, ascending, casters, expected_result):
+    """Test class `_MergeKey` from module results.
+
+    Parameters
+    ----------
+    a : list
+        Values wrapped by the left key.
+    b : list
+        Values wrapped by the right key.
+    ascending : list(bool)
+        True for ascending, False otherwise.
+    casters : list
+        Callables applied to each value before comparing.
+    expected_result : bool
+        Expected result of the `<` comparison.
+    """
+    assert (_MergeKey(a, ascending, casters) < _MergeKey(b, ascending, casters)) == expected_result
+
+
+@pytest.mark.parametrize(
+    'ids, expected_result',
+    [
+        (['010', '002', '001'], ['001', '002', '010']),
+        ({'002', '001'}, ['001', '002']),
+        (['b', 'a', '001'], ['001', 'a', 'b']),
+    ],
+)
+def test_results__sort_ids(ids, expected_result):
+    """Test function `_sort_ids` from module results.
+
+    Parameters
+    ----------
+    ids : iterable
+        IDs to sort, numerically when every ID casts to int.
+    expected_result : list
+        Expected result after the function call.
+    """
+    assert _sort_ids(ids) == expected_result
+
+
 @pytest.mark.parametrize(
     'iterables, criteria, ascending, types, expected_result',
     [
@@ -385,3 +472,12 @@ def test_results_merge(iterables, criteria, ascending, types, expected_result):
         Expected results after merge.
     """
     assert merge(*iterables, criteria=criteria, ascending=ascending, types=types) == expected_result
+
+
+def test_results_merge_presorted_dicts():
+    """Test function `merge` from module results with pre-sorted dict lists, checking inputs are not mutated."""
+    iterable_1 = [{'id': '001'}, {'id': '003'}]
+    iterable_2 = [{'id': '002'}, {'id': '004'}]
+    merge_result = merge(iterable_1, iterable_2, criteria=['id'], ascending=[True], types=['int'])
+    assert [item['id'] for item in merge_result] == ['001', '002', '003', '004']
+    assert len(iterable_1) == 2 and len(iterable_2) == 2